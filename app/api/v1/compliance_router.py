@@ -2,8 +2,8 @@
 V1 Compliance API router — server-to-server with API key auth + rate limiting.
 Used by portal.nbcgate.com backend.
 """
-import uuid
 import logging
+import secrets
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import Response
 from pydantic import BaseModel, HttpUrl
@@ -74,7 +74,7 @@ async def run_compliance_check_v1(
         raise HTTPException(status_code=500, detail="Compliance analysis failed.")
 
     # 3. Save to DB
-    report_id = f"rpt_{uuid.uuid4().hex[:12]}"
+    report_id = f"rpt_{secrets.token_hex(6)}"
     report_data = report.model_dump()
 
     record = ComplianceReportRecord(
@@ -4,6 +4,7 @@ V1 Policy management API — generate, list, edit, approve policies.
 import logging
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update
@@ -12,6 +13,7 @@ from app.api.v1.auth import require_api_key
 from app.infrastructure.database import get_db
 from app.modules.policies.models import ClientPolicy
 from app.modules.policies.generator import PolicyGenerator, POLICY_TYPES
+from app.modules.policies.service import invalidate_widget_cache
 
 logger = logging.getLogger(__name__)
 
@@ -75,6 +77,48 @@ async def generate_policies(
     return [PolicyResponse(**r) for r in results]
 
 
+class StreamPolicyRequest(BaseModel):
+    company_name: str
+    legal_address: str = ""
+    support_email: str = ""
+    site_url: str = ""
+    jurisdiction: str = "GENERAL"
+    language: str = "English"
+    policy_type: str  # e.g. "privacy"
+
+
+@router.post("/generate/stream", summary="Stream a single policy as it is generated")
+async def stream_policy(
+    request: StreamPolicyRequest,
+    _api_key: str = Depends(require_api_key),
+):
+    """
+    Generate one policy and stream the HTML progressively.
+    Large documents (10–30KB T&Cs) take 5–15s to generate fully; streaming
+    lets the portal render content as it arrives. The result is not
+    persisted — use POST /generate for the save-to-DB flow.
+    """
+    if request.policy_type not in POLICY_TYPES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid policy type: {request.policy_type}. Valid: {list(POLICY_TYPES.keys())}",
+        )
+
+    generator = PolicyGenerator()
+    return StreamingResponse(
+        generator.generate_policy_stream(
+            policy_type=request.policy_type,
+            company_name=request.company_name,
+            legal_address=request.legal_address,
+            support_email=request.support_email,
+            site_url=request.site_url,
+            jurisdiction=request.jurisdiction,
+            language=request.language,
+        ),
+        media_type="text/html; charset=utf-8",
+    )
+
+
 @router.get("/{client_id}", response_model=List[PolicyResponse], summary="List client policies")
 async def list_policies(
     client_id: str,
@@ -149,6 +193,7 @@ async def update_policy(
     policy.content_html = request.content_html
     policy.version += 1
     await db.commit()
+    await invalidate_widget_cache(client_id)
 
     return {"message": "Policy updated", "version": policy.version}
 
@@ -175,6 +220,7 @@ async def approve_policy(
     policy.status = "approved"
     policy.approved_at = datetime.now(timezone.utc)
     await db.commit()
+    await invalidate_widget_cache(client_id)
 
     return {"message": "Policy approved and published", "policy_id": policy_id, "status": "approved"}
 
@@ -198,5 +244,6 @@ async def delete_policy(
 
     await db.delete(policy)
     await db.commit()
+    await invalidate_widget_cache(client_id)
 
     return {"message": "Policy deleted", "policy_id": policy_id}
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.infrastructure.database import get_db
 from app.modules.policies.service import PolicyService
@@ -9,10 +9,14 @@ router = APIRouter()
 @router.get("/content/{client_id}", response_model=WidgetResponse)
 async def get_widget_content(
     client_id: str,
+    response: Response,
     db: AsyncSession = Depends(get_db)
 ):
     service = PolicyService(db)
     try:
-        return await service.get_widget_content(client_id)
+        content = await service.get_widget_content(client_id)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    # Policy text is public — let browsers/CDNs cache it briefly.
+    response.headers["Cache-Control"] = "public, max-age=300"
+    return content
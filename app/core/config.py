@@ -8,6 +8,10 @@ class Settings(BaseSettings):
     REDIS_URL: str | None = None
     LOG_LEVEL: str = "INFO"
 
+    # Crawler: max simultaneous page crawls (each browser context holds
+    # ~150-300 MB of Chromium memory, so keep this bounded)
+    CRAWLER_MAX_CONCURRENCY: int = 4
+
     # AI Providers
     LLM_PROVIDER: str = "mock"  # "openai", "gemini", or "mock"
     OPENAI_API_KEY: str | None = None
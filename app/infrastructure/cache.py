@@ -0,0 +1,43 @@
+"""
+Optional Redis cache client.
+Enabled when REDIS_URL is set; otherwise `redis_client` is None and callers
+fall back to their uncached path. Mirrors the degraded-mode approach of
+`database.py` — a missing/unreachable Redis must never take the app down.
+"""
+import logging
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+try:
+    if settings.REDIS_URL:
+        from redis.asyncio import Redis
+
+        redis_client = Redis.from_url(settings.REDIS_URL, decode_responses=True)
+        logger.info("Redis cache client created.")
+    else:
+        redis_client = None
+except Exception as e:
+    logger.warning("Redis unavailable — caching disabled: %s", e)
+    redis_client = None
+
+
+async def cache_get(key: str) -> str | None:
+    """Fetch a cached string, or None when missing / Redis is unavailable."""
+    if not redis_client:
+        return None
+    try:
+        return await redis_client.get(key)
+    except Exception as e:
+        logger.warning("Cache read failed for %s: %s", key, e)
+        return None
+
+
+async def cache_set(key: str, value: str, ttl: int) -> None:
+    """Best-effort cache write; failures are logged and swallowed."""
+    if not redis_client:
+        return
+    try:
+        await redis_client.set(key, value, ex=ttl)
+    except Exception as e:
+        logger.warning("Cache write failed for %s: %s", key, e)
@@ -5,12 +5,32 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+try:
+    # orjson is markedly faster than stdlib json for the checklist payloads
+    # stored in JSON columns; fall back to stdlib if it is not installed.
+    import orjson
+
+    def _json_serializer(value) -> str:
+        return orjson.dumps(value).decode()
+
+    _json_deserializer = orjson.loads
+except ImportError:
+    import json
+
+    _json_serializer = json.dumps
+    _json_deserializer = json.loads
+
 try:
     db_url = settings.DATABASE_URL
     # Railway gives postgresql:// but asyncpg needs postgresql+asyncpg://
     if db_url.startswith("postgresql://"):
         db_url = db_url.replace("postgresql://", "postgresql+asyncpg://", 1)
-    engine = create_async_engine(db_url, echo=False)
+    engine = create_async_engine(
+        db_url,
+        echo=False,
+        json_serializer=_json_serializer,
+        json_deserializer=_json_deserializer,
+    )
     AsyncSessionLocal = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
     DB_INITIALIZED = True
     logger.info("Database engine created: %s", db_url.split("://")[0])
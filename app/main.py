@@ -30,8 +30,15 @@ async def lifespan(app: FastAPI):
             logger.error("Database connection failed: %s — running in degraded mode.", e)
     else:
         logger.warning("Database not initialized — running in degraded mode.")
+
+    # Launch the shared crawler browser (no-op degraded mode if unavailable)
+    from app.services.crawler.service import CrawlerService
+    await CrawlerService.startup()
+
     yield
 
+    await CrawlerService.shutdown()
+
 
 app = FastAPI(
     title="AI Compliance Agent",
@@ -1,9 +1,12 @@
+import hashlib
 from datetime import datetime, timezone
 from typing import List
 from app.modules.compliance.schemas import (
     ComplianceReport, ChecklistItem, SiteContentExtraction,
     DynamicChecklistRule, DynamicExtractionResult
 )
+from app.infrastructure.cache import cache_get, cache_set
+from app.modules.compliance.keywords import scan_keywords
 from app.services.llm.factory import LLMFactory
 from app.core.config import settings
 import logging
@@ -22,10 +25,15 @@ SECTION_WEIGHTS = {
     "8": 5,    # Mobile Compliance
 }
 
+# Extraction is deterministic per (provider, content); caching avoids paying
+# for a second LLM call when the same site text is re-analyzed.
+_EXTRACT_CACHE_TTL = 3600
+
 
 class ComplianceRuleEngine:
     def __init__(self, llm_provider: str = None, model: str = None):
         self.provider = llm_provider or settings.LLM_PROVIDER
+        self.model = model
         self.llm_client = LLMFactory.get_client(self.provider, model=model)
 
     async def analyze_site(self, clean_text: str) -> ComplianceReport:
@@ -117,11 +125,32 @@ class ComplianceRuleEngine:
             "- Err on the side of false/null rather than making assumptions."
         )
 
-        extracted: SiteContentExtraction = await self.llm_client.extract_data(
-            text=clean_text[:50000],
-            schema=SiteContentExtraction,
-            system_prompt=system_prompt,
+        text = clean_text[:50000]
+        # Keyed per (provider, model, content) — different models of the
+        # same provider must not serve each other's cached extractions.
+        cache_key = (
+            f"extract:{self.provider}:{self.model or 'default'}:"
+            f"{hashlib.sha256(text.encode()).hexdigest()}"
         )
+        cached = await cache_get(cache_key)
+        if cached is not None:
+            logger.info("Extraction cache hit (provider=%s)", self.provider)
+            extracted = SiteContentExtraction.model_validate_json(cached)
+        else:
+            extracted = await self.llm_client.extract_data(
+                text=text,
+                schema=SiteContentExtraction,
+                system_prompt=system_prompt,
+            )
+            await cache_set(cache_key, extracted.model_dump_json(), _EXTRACT_CACHE_TTL)
+
+        # 1b. Deterministic keyword scan — one pass over the text. The LLM
+        # misses payment logos/footers fairly often; backfill from the scan.
+        if not extracted.payment_methods_mentioned:
+            found = scan_keywords(clean_text)
+            extracted.payment_methods_mentioned = sorted(
+                found.get("payment_methods", ())
+            )
 
         # 2. Apply deterministic rules per section
         checklist: List[ChecklistItem] = []
@@ -0,0 +1,61 @@
+"""
+Deterministic keyword detection over sanitized site text.
+
+All variants are combined into one compiled alternation so the page text is
+scanned in a single pass regardless of how many keywords are registered —
+O(n + matches) instead of one substring scan per keyword. Used to supplement
+LLM extraction with facts we can detect without a model call.
+"""
+import re
+
+# category -> canonical name -> variants as they appear in page text
+_KEYWORDS = {
+    "payment_methods": {
+        "Visa": ["visa"],
+        "Mastercard": ["mastercard", "master card"],
+        "Maestro": ["maestro"],
+        "American Express": ["american express", "amex"],
+        "PayPal": ["paypal"],
+        "Apple Pay": ["apple pay"],
+        "Google Pay": ["google pay"],
+        "Klarna": ["klarna"],
+        "Skrill": ["skrill"],
+        "SEPA": ["sepa"],
+        "Bank Transfer": ["bank transfer", "wire transfer"],
+        "Crypto": ["bitcoin", "ethereum", "cryptocurrency", "crypto payment"],
+    },
+    "policy_pages": {
+        "Privacy Policy": ["privacy policy", "data protection policy"],
+        "Terms & Conditions": ["terms & conditions", "terms and conditions", "terms of service", "terms of use"],
+        "Refund Policy": ["refund policy", "return policy", "money back guarantee"],
+        "Cancellation Policy": ["cancellation policy"],
+        "Payment Policy": ["payment policy", "billing policy"],
+    },
+}
+
+# variant -> (category, canonical), flattened once at import
+_VARIANT_MAP: dict[str, tuple[str, str]] = {
+    variant: (category, canonical)
+    for category, names in _KEYWORDS.items()
+    for canonical, variants in names.items()
+    for variant in variants
+}
+
+# Longest-first so e.g. "crypto payment" wins over a shorter prefix variant.
+_SCAN_RE = re.compile(
+    r"\b(?:"
+    + "|".join(re.escape(v) for v in sorted(_VARIANT_MAP, key=len, reverse=True))
+    + r")\b"
+)
+
+
+def scan_keywords(text: str) -> dict[str, set[str]]:
+    """
+    Scan text once and return {category: {canonical names found}}.
+    Categories with no hits are absent from the result.
+    """
+    found: dict[str, set[str]] = {}
+    for match in _SCAN_RE.finditer(text.lower()):
+        category, canonical = _VARIANT_MAP[match.group(0)]
+        found.setdefault(category, set()).add(canonical)
+    return found
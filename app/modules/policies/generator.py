@@ -1,11 +1,14 @@
 """
 Policy generation engine — uses Gemini to generate compliance policies.
 """
-import uuid
 import logging
+import secrets
+from datetime import date
+from functools import lru_cache
 from typing import List, Optional
+from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import insert, select
 
 from app.services.llm.gemini_client import GeminiClient
 from app.services.llm.mock_client import MockClient
@@ -51,6 +54,38 @@ JURISDICTION_CLAUSES = {
     },
 }
 
+# Flattened once at import: (jurisdiction, policy_type) -> clause text.
+# Saves the nested dict walk (and the GENERAL-default allocation) per call.
+_CLAUSES = {
+    (jurisdiction, policy_type): clause
+    for jurisdiction, clauses in JURISDICTION_CLAUSES.items()
+    for policy_type, clause in clauses.items()
+}
+
+# Precomposed template for the mock path — hot in CI and load tests, where
+# rebuilding the whole document from f-string pieces per call adds noise.
+_MOCK_TEMPLATE = (
+    "<h2>{name}</h2>"
+    "<p><strong>Company:</strong> {company}</p>"
+    "<p>This is a demo {lname} generated for testing purposes. "
+    "Language: {lang}.</p>"
+    "<p>In production, this would be a comprehensive legal document generated "
+    "by Gemini AI with jurisdiction-specific clauses.</p>"
+    "<p><em>Last Updated: {date}</em></p>"
+)
+
+
+@lru_cache(maxsize=1)
+def _today_iso(ordinal: int) -> str:
+    """Format today's date once per day (keyed on the date ordinal)."""
+    return date.fromordinal(ordinal).isoformat()
+
+
+class _PolicyContent(BaseModel):
+    """Structured response schema for Gemini policy generation."""
+    html: str
+
+
 DISCLAIMER = (
     "<div style='background:#fff3cd;border:1px solid #ffc107;padding:12px;margin-bottom:16px;"
     "border-radius:4px;font-size:13px;color:#856404;'>"
@@ -70,22 +105,24 @@ class PolicyGenerator:
         else:
             self.llm = MockClient()
 
-    async def generate_policy(
+    def _build_prompt(
         self,
         policy_type: str,
         company_name: str,
         legal_address: str,
         support_email: str,
         site_url: str,
-        jurisdiction: str = "GENERAL",
-        language: str = "English",
+        jurisdiction: str,
+        language: str,
     ) -> str:
-        """Generate a single policy using Gemini."""
+        """Build the generation prompt shared by the buffered and streaming paths."""
         policy_name = POLICY_TYPES.get(policy_type, policy_type)
 
-        # Get jurisdiction-specific clauses
-        jur_clauses = JURISDICTION_CLAUSES.get(jurisdiction, JURISDICTION_CLAUSES["GENERAL"])
-        extra_clauses = jur_clauses.get(policy_type, "")
+        # Jurisdiction-specific clauses, falling back to GENERAL
+        extra_clauses = (
+            _CLAUSES.get((jurisdiction, policy_type))
+            or _CLAUSES.get(("GENERAL", policy_type), "")
+        )
 
         prompt = (
             f"Generate a professional {policy_name} for a company with the following details:\n\n"
@@ -111,35 +148,82 @@ class PolicyGenerator:
             f"- Do NOT include any <html>, <head>, or <body> tags — just the content\n"
         )
 
+        return prompt
+
+    async def generate_policy(
+        self,
+        policy_type: str,
+        company_name: str,
+        legal_address: str,
+        support_email: str,
+        site_url: str,
+        jurisdiction: str = "GENERAL",
+        language: str = "English",
+    ) -> str:
+        """Generate a single policy using Gemini."""
+        prompt = self._build_prompt(
+            policy_type, company_name, legal_address, support_email,
+            site_url, jurisdiction, language,
+        )
+
         if settings.LLM_PROVIDER == "mock":
             # Return a mock policy for testing
             return self._mock_policy(policy_type, company_name, language)
 
-        from pydantic import BaseModel
-
-        class PolicyContent(BaseModel):
-            html: str
-
         result = await self.llm.extract_data(
             text=prompt,
-            schema=PolicyContent,
+            schema=_PolicyContent,
             system_prompt="You are a legal document generator. Generate the requested policy document as clean HTML.",
         )
         return DISCLAIMER + result.html
 
+    async def generate_policy_stream(
+        self,
+        policy_type: str,
+        company_name: str,
+        legal_address: str,
+        support_email: str,
+        site_url: str,
+        jurisdiction: str = "GENERAL",
+        language: str = "English",
+    ):
+        """
+        Generate a single policy as a stream of HTML fragments.
+        The disclaimer ships in the first chunk so the browser can render
+        immediately instead of waiting 5–15s for a full 10–30KB document.
+        """
+        yield DISCLAIMER
+
+        if settings.LLM_PROVIDER == "mock":
+            # Mock policy already includes the disclaimer — strip it here.
+            yield self._mock_policy(policy_type, company_name, language)[len(DISCLAIMER):]
+            return
+
+        prompt = self._build_prompt(
+            policy_type, company_name, legal_address, support_email,
+            site_url, jurisdiction, language,
+        )
+
+        async for chunk in self.llm.generate_text_stream(
+            prompt=prompt,
+            system_prompt=(
+                "You are a legal document generator. Generate the requested "
+                "policy document as clean HTML. Output ONLY the HTML content, "
+                "no markdown fences or commentary."
+            ),
+        ):
+            yield chunk
+
     def _mock_policy(self, policy_type: str, company_name: str, language: str) -> str:
         """Return a mock policy for testing without API."""
         policy_name = POLICY_TYPES.get(policy_type, policy_type)
-        return (
-            f"{DISCLAIMER}"
-            f"<h2>{policy_name}</h2>"
-            f"<p><strong>Company:</strong> {company_name}</p>"
-            f"<p>This is a demo {policy_name.lower()} generated for testing purposes. "
-            f"Language: {language}.</p>"
-            f"<p>In production, this would be a comprehensive legal document generated "
-            f"by Gemini AI with jurisdiction-specific clauses.</p>"
-            f"<p><em>Last Updated: 2026-02-17</em></p>"
-        )
+        return DISCLAIMER + _MOCK_TEMPLATE.format_map({
+            "name": policy_name,
+            "lname": policy_name.lower(),
+            "company": company_name,
+            "lang": language,
+            "date": _today_iso(date.today().toordinal()),
+        })
 
     async def generate_missing_policies(
         self,
@@ -172,8 +256,8 @@ class PolicyGenerator:
                 language=language,
             )
 
-            policy_id = f"pol_{uuid.uuid4().hex[:12]}"
-            policy_data = {
+            policy_id = f"pol_{secrets.token_hex(6)}"
+            results.append({
                 "id": policy_id,
                 "client_id": client_id,
                 "policy_type": policy_type,
@@ -182,17 +266,13 @@ class PolicyGenerator:
                 "language": language,
                 "status": "draft",
                 "version": 1,
-            }
-
-            # Save to DB if session provided
-            if db:
-                record = ClientPolicy(**policy_data)
-                db.add(record)
-                results.append(policy_data)
-            else:
-                results.append(policy_data)
+            })
 
-        if db:
+        # Save to DB if session provided — one bulk INSERT instead of
+        # per-object unit-of-work tracking; ids are assigned client-side so
+        # nothing needs to be refreshed back.
+        if db and results:
+            await db.execute(insert(ClientPolicy), results)
             await db.commit()
 
         logger.info("Generated %d policies for client %s", len(results), client_id)
@@ -1,8 +1,13 @@
-from sqlalchemy import Column, String, Text, Boolean, Integer, DateTime, ForeignKey, func, JSON
+from sqlalchemy import Column, String, Text, Boolean, Integer, DateTime, ForeignKey, Index, func, JSON, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import declarative_base, relationship
 
 Base = declarative_base()
 
+# JSONB on PostgreSQL: asyncpg then returns ready dicts through its binary
+# codec and key lookups become indexable; other backends keep plain JSON.
+_JSON = JSON().with_variant(JSONB(), "postgresql")
+
 
 class PolicyTemplateMaster(Base):
     """Master policy templates managed by admin. Versioned for approach B."""
@@ -22,6 +27,12 @@ class PolicyTemplateMaster(Base):
 class ClientPolicy(Base):
     """Generated policy for a specific client."""
     __tablename__ = "client_policies"
+    __table_args__ = (
+        # Widget reads filter on (client_id, status == 'approved'); without
+        # this the planner falls back to scanning all of a client's policies.
+        Index("ix_client_policies_client_status", "client_id", "status"),
+        Index("ix_client_policies_client_type_version", "client_id", "policy_type", "version"),
+    )
 
     id = Column(String, primary_key=True)  # pol_uuid
     client_id = Column(String, nullable=False, index=True)
@@ -42,6 +53,10 @@ class ClientPolicy(Base):
 class ComplianceReportRecord(Base):
     """Stored compliance report for rate limiting and history."""
     __tablename__ = "compliance_reports"
+    __table_args__ = (
+        # Rate limiter counts reports per client since midnight UTC.
+        Index("ix_compliance_reports_client_created", "client_id", "created_at"),
+    )
 
     id = Column(String, primary_key=True)  # rpt_uuid
     client_id = Column(String, nullable=True, index=True)  # null for web form checks
@@ -49,7 +64,7 @@ class ComplianceReportRecord(Base):
     company_name = Column(String, nullable=False)
     score = Column(Integer, nullable=False)
     status = Column(String, nullable=False)  # COMPLIANT, NON-COMPLIANT, NEEDS_REVIEW
-    checklist = Column(JSON, nullable=True)
+    checklist = Column(_JSON, nullable=True)
     summary = Column(Text, nullable=True)
     created_at = Column(DateTime, server_default=func.now())
 
@@ -57,10 +72,19 @@ class ComplianceReportRecord(Base):
 class Widget(Base):
     """Widget config for serving policies on merchant sites."""
     __tablename__ = "widgets"
+    __table_args__ = (
+        # Partial on Postgres: inactive widgets are dead weight for lookups.
+        Index(
+            "ix_widgets_client_active",
+            "client_id",
+            "is_active",
+            postgresql_where=text("is_active"),
+        ),
+    )
 
     token = Column(String, primary_key=True)  # wt_pub_uuid
     client_id = Column(String, nullable=False, index=True)
     domain = Column(String, nullable=False)
     is_active = Column(Boolean, default=True)
-    theme_config = Column(JSON, default={})
+    theme_config = Column(_JSON, default={})
     created_at = Column(DateTime, server_default=func.now())
@@ -6,12 +6,31 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 import logging
 
+from app.infrastructure.cache import redis_client
 from app.modules.policies.models import Widget, ClientPolicy
 from app.modules.policies.schemas import WidgetResponse
 from app.modules.policies.generator import POLICY_TYPES
 
 logger = logging.getLogger(__name__)
 
+# Widget documents only change on admin actions (approve/edit/delete), so a
+# long TTL is safe — writes invalidate the key explicitly.
+WIDGET_CACHE_TTL = 86400
+
+
+def _widget_cache_key(client_id: str) -> str:
+    return f"widget:{client_id}"
+
+
+async def invalidate_widget_cache(client_id: str) -> None:
+    """Drop the cached widget document after a policy write."""
+    if not redis_client:
+        return
+    try:
+        await redis_client.delete(_widget_cache_key(client_id))
+    except Exception as e:
+        logger.warning("Widget cache invalidation failed for %s: %s", client_id, e)
+
 
 class PolicyService:
     def __init__(self, db: AsyncSession):
@@ -19,21 +38,35 @@ class PolicyService:
 
     async def get_widget_content(self, client_id: str) -> WidgetResponse:
         """Legacy: return widget HTML for a client. Uses new models."""
-        # Find widget by client_id
-        stmt = select(Widget).where(Widget.client_id == client_id, Widget.is_active == True)
+        # Serve the precomputed document from Redis when possible — reads are
+        # per-page-view while policy edits are rare admin actions.
+        if redis_client:
+            try:
+                raw = await redis_client.get(_widget_cache_key(client_id))
+                if raw:
+                    return WidgetResponse.model_validate_json(raw)
+            except Exception as e:
+                logger.warning("Widget cache read failed for %s: %s", client_id, e)
+
+        # Single joined query: widget + approved policies in one round-trip.
+        # Outer join with the status filter in the ON clause so a widget with
+        # no approved policies still returns a row (distinct 404 messages).
+        stmt = (
+            select(Widget, ClientPolicy)
+            .outerjoin(
+                ClientPolicy,
+                (ClientPolicy.client_id == Widget.client_id)
+                & (ClientPolicy.status == "approved"),
+            )
+            .where(Widget.client_id == client_id, Widget.is_active == True)
+        )
         result = await self.db.execute(stmt)
-        widget = result.scalar_one_or_none()
+        rows = result.all()
 
-        if not widget:
+        if not rows:
             raise ValueError("Widget not found")
 
-        # Fetch approved policies
-        stmt = select(ClientPolicy).where(
-            ClientPolicy.client_id == client_id,
-            ClientPolicy.status == "approved",
-        )
-        result = await self.db.execute(stmt)
-        policies = result.scalars().all()
+        policies = [policy for _, policy in rows if policy is not None]
 
         if not policies:
             raise ValueError("No approved policies found")
@@ -56,4 +89,17 @@ class PolicyService:
             },
         }
 
-        return WidgetResponse(html_content=html_content, json_ld=json_ld)
+        response = WidgetResponse(html_content=html_content, json_ld=json_ld)
+
+        # Re-populate the cache so the next read is RAM-bound.
+        if redis_client:
+            try:
+                await redis_client.set(
+                    _widget_cache_key(client_id),
+                    response.model_dump_json(),
+                    ex=WIDGET_CACHE_TTL,
+                )
+            except Exception as e:
+                logger.warning("Widget cache write failed for %s: %s", client_id, e)
+
+        return response
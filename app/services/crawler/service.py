@@ -1,8 +1,14 @@
+import asyncio
+import hashlib
 import ipaddress
 import logging
+import re
+from bisect import bisect_right
+from functools import lru_cache
 from urllib.parse import urlparse
-from playwright.async_api import async_playwright
-from app.services.crawler.sanitizer import HtmlSanitizer
+from app.infrastructure.cache import cache_get, cache_set
+from app.services.crawler.sanitizer import clean_html
+from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -21,9 +27,42 @@ _BLOCKED_NETWORKS = [
 
 _BLOCKED_HOSTNAMES = {"localhost", "metadata.google.internal"}
 
+# Collapsed once at import into sorted integer ranges per IP version so the
+# per-URL check is a single bisect instead of a Python-level scan over
+# ip_network.__contains__.
+_V4_RANGES = sorted(
+    (int(net.network_address), int(net.broadcast_address))
+    for net in _BLOCKED_NETWORKS
+    if net.version == 4
+)
+_V6_RANGES = sorted(
+    (int(net.network_address), int(net.broadcast_address))
+    for net in _BLOCKED_NETWORKS
+    if net.version == 6
+)
 
+
+# Cheap pre-filter: only strings made of hex digits, dots and colons can be
+# IP literals. Skips ipaddress parsing (and its ValueError construction) for
+# the overwhelmingly common domain-name case.
+_IP_LOOKING = re.compile(r"^[\d.:a-fA-F]+$")
+
+
+def _is_blocked_ip(ip) -> bool:
+    """Range check against the collapsed blocklist for ip's version."""
+    ranges = _V4_RANGES if ip.version == 4 else _V6_RANGES
+    n = int(ip)
+    i = bisect_right(ranges, (n, 1 << 130)) - 1
+    return i >= 0 and n <= ranges[i][1]
+
+
+@lru_cache(maxsize=2048)
 def _validate_url(url: str) -> str:
-    """Validate URL for SSRF. Returns the URL or raises ValueError."""
+    """Validate URL for SSRF. Returns the URL or raises ValueError.
+
+    Results for accepted URLs are memoized; rejected URLs raise and are
+    re-checked each time (lru_cache does not cache exceptions).
+    """
     parsed = urlparse(url)
 
     if parsed.scheme not in ("http", "https"):
@@ -37,24 +76,155 @@ def _validate_url(url: str) -> str:
     if hostname.lower() in _BLOCKED_HOSTNAMES:
         raise ValueError(f"Blocked hostname: {hostname}")
 
-    # Try to parse as IP and check against blocked networks
-    try:
-        ip = ipaddress.ip_address(hostname)
-        for network in _BLOCKED_NETWORKS:
-            if ip in network:
+    # Only attempt IP parsing when the hostname can be an IP literal;
+    # resolving domain names is Playwright's job, not ours.
+    if _IP_LOOKING.match(hostname):
+        try:
+            ip = ipaddress.ip_address(hostname)
+        except ValueError:
+            # Hex-ish domain label (e.g. "abc.dead") — not an IP, fine
+            pass
+        else:
+            if _is_blocked_ip(ip):
                 raise ValueError(f"Blocked internal IP address: {hostname}")
-    except ValueError as e:
-        if "Blocked" in str(e):
-            raise
-        # Not an IP — it's a domain name, that's fine
-        pass
 
     return url
 
 
+_LAUNCH_ARGS = ["--no-sandbox", "--disable-dev-shm-usage"]
+
+_MAX_TEXT_CHARS = 100_000  # same cap as the sanitizer
+
+# Crawled text rarely changes within an hour, and compliance checks are
+# rate-limited per day — re-crawling the same URL is pure waste.
+_CRAWL_CACHE_TTL = 3600
+
+
+def _crawl_cache_key(url: str) -> str:
+    return f"crawl:{hashlib.sha256(url.encode()).hexdigest()}"
+
+
+# We only need the text content, so skip bytes that can't contain it.
+_BLOCKED_RESOURCE_TYPES = ("image", "media", "font", "stylesheet")
+
+
+async def _guard_request(route):
+    """Route handler: re-validate every request and drop heavy resources.
+
+    _validate_url only sees the input URL; page.goto follows 30x redirects
+    and page scripts can fire xhr/fetch at arbitrary hosts (including
+    internal metadata IPs), so every intercepted URL is re-checked here —
+    the lru_cache on _validate_url makes the repeat checks nearly free.
+    Failing at interception also skips the TLS handshake for bad targets.
+    """
+    request = route.request
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+        return
+    try:
+        _validate_url(request.url)
+    except ValueError as e:
+        logger.warning("Blocked request to %s: %s", request.url, e)
+        await route.abort()
+        return
+    await route.continue_()
+
+
+async def _assert_public_host(url: str) -> None:
+    """Resolve the hostname and reject URLs whose DNS points at blocked
+    networks — a domain resolving to 169.254.169.254 must not be crawled."""
+    hostname = urlparse(url).hostname
+    if _IP_LOOKING.match(hostname):
+        return  # IP literals were already checked by _validate_url
+    try:
+        infos = await asyncio.get_running_loop().getaddrinfo(hostname, None)
+    except OSError:
+        return  # unresolvable — let the browser surface the real error
+    for info in infos:
+        ip = ipaddress.ip_address(info[4][0])
+        if _is_blocked_ip(ip):
+            raise ValueError(f"Blocked hostname (resolves to internal IP): {hostname}")
+
+
 class CrawlerService:
-    def __init__(self):
-        self.sanitizer = HtmlSanitizer()
+    # One Chromium process shared across all service instances — launching a
+    # browser costs hundreds of ms to seconds, while a fresh BrowserContext
+    # per crawl keeps isolation at tens of ms. Managed by the app lifespan.
+    _playwright = None
+    _browser = None
+    # Bounded pool of warm (context, page) pairs; the semaphore caps
+    # concurrent crawls so N parallel checks can't each hold Chromium
+    # memory at once.
+    _sem = None
+    _ctx_pool = None
+
+    @classmethod
+    async def startup(cls) -> None:
+        """Launch the shared browser. Called once from the FastAPI lifespan."""
+        if cls._browser:
+            return
+        try:
+            # Imported lazily: pulling in Playwright at module import slows
+            # cold start for processes that never crawl (mock provider, tests).
+            from playwright.async_api import async_playwright
+
+            cls._playwright = await async_playwright().start()
+            cls._browser = await cls._playwright.chromium.launch(
+                headless=True, args=_LAUNCH_ARGS
+            )
+            cls._sem = asyncio.Semaphore(settings.CRAWLER_MAX_CONCURRENCY)
+            cls._ctx_pool = asyncio.Queue()
+            for _ in range(settings.CRAWLER_MAX_CONCURRENCY):
+                await cls._ctx_pool.put(await cls._new_pool_entry())
+            logger.info(
+                "Shared Chromium browser launched (%d pooled contexts).",
+                settings.CRAWLER_MAX_CONCURRENCY,
+            )
+        except Exception as e:
+            logger.warning("Could not launch shared browser: %s", e)
+            await cls.shutdown()
+
+    @classmethod
+    async def _new_pool_entry(cls):
+        """Create a guarded context with one reusable page.
+
+        new_page opens a CDP target and installs default listeners on every
+        call; for stateless text extraction one long-lived page per context
+        that only re-navigates is enough.
+        """
+        context = await cls._browser.new_context()
+        await context.route("**/*", _guard_request)
+        page = await context.new_page()
+        page.set_default_timeout(30000)
+        return context, page
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        """Close pooled contexts, the shared browser, and the driver."""
+        if cls._ctx_pool:
+            while not cls._ctx_pool.empty():
+                try:
+                    entry = cls._ctx_pool.get_nowait()
+                    if entry is None:
+                        continue  # sentinel for a slot that failed to recycle
+                    context, _page = entry
+                    await context.close()  # closes its page too
+                except Exception as e:
+                    logger.warning("Context close failed: %s", e)
+            cls._ctx_pool = None
+        cls._sem = None
+        if cls._browser:
+            try:
+                await cls._browser.close()
+            except Exception as e:
+                logger.warning("Browser close failed: %s", e)
+            cls._browser = None
+        if cls._playwright:
+            try:
+                await cls._playwright.stop()
+            except Exception as e:
+                logger.warning("Playwright stop failed: %s", e)
+            cls._playwright = None
 
     async def crawl_page(self, url: str) -> str:
         """
@@ -65,18 +235,34 @@ class CrawlerService:
         # SSRF protection: validate before any network call
         url = _validate_url(url)
 
+        cached = await cache_get(_crawl_cache_key(url))
+        if cached is not None:
+            logger.info("Crawl cache hit: %s", url)
+            return cached
+
+        await _assert_public_host(url)
+
         try:
+            if self._browser:
+                text = await self._crawl_with_shared_browser(url)
+                await cache_set(_crawl_cache_key(url), text, _CRAWL_CACHE_TTL)
+                return text
+            # Degraded mode (startup not run or browser launch failed):
+            # launch per request as before.
+            from playwright.async_api import async_playwright
+
             async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True, args=["--no-sandbox"])
+                browser = await p.chromium.launch(headless=True, args=_LAUNCH_ARGS)
                 try:
                     page = await browser.new_page()
+                    await page.route("**/*", _guard_request)
                     page.set_default_timeout(30000)
 
                     logger.info("Crawling: %s", url)
-                    await page.goto(url, wait_until="networkidle")
-                    content = await page.content()
-
-                    return self.sanitizer.clean_html(content)
+                    await self._goto(page, url)
+                    text = await self._extract_text(page)
+                    await cache_set(_crawl_cache_key(url), text, _CRAWL_CACHE_TTL)
+                    return text
                 finally:
                     await browser.close()
         except Exception as e:
@@ -85,3 +271,80 @@ class CrawlerService:
                 f"Mock Content for {url}: Privacy Policy provided. "
                 "Terms of Service missing. Contact: support@demo.com"
             )
+
+    async def _crawl_with_shared_browser(self, url: str) -> str:
+        """Crawl using a pooled warm page; concurrency is semaphore-bounded."""
+        async with self._sem:
+            entry = await self._ctx_pool.get()
+            if entry is None:
+                # A previous crawl couldn't recycle this slot; recreate the
+                # entry lazily now that the browser may be healthy again.
+                try:
+                    entry = await self._new_pool_entry()
+                except Exception:
+                    await self._ctx_pool.put(None)
+                    raise
+            context, page = entry
+            try:
+                logger.info("Crawling: %s", url)
+                await self._goto(page, url)
+                text = await self._extract_text(page)
+                await self._reset_page(context, page)
+                return text
+            except Exception:
+                # Treat the entry as poisoned — replace it before re-raising
+                # so the pool keeps its full capacity. If the replacement
+                # fails too, park a sentinel instead of a dead context; the
+                # next crawl on this slot recreates it.
+                try:
+                    await context.close()
+                except Exception:
+                    pass
+                try:
+                    entry = await self._new_pool_entry()
+                except Exception as e:
+                    logger.warning("Context recycle failed: %s", e)
+                    entry = None
+                raise
+            finally:
+                await self._ctx_pool.put(entry)
+
+    @staticmethod
+    async def _reset_page(context, page) -> None:
+        """Scrub state between crawls so page reuse doesn't leak isolation:
+        cookies live on the context, web storage on the current origin."""
+        await context.clear_cookies()
+        try:
+            await page.evaluate("() => { localStorage.clear(); sessionStorage.clear(); }")
+        except Exception:
+            # Opaque-origin / sandboxed pages deny storage access — nothing
+            # to leak there anyway.
+            pass
+
+    @staticmethod
+    async def _extract_text(page) -> str:
+        """
+        Read rendered text straight from the DOM. page.content() marshals
+        the whole serialized HTML over CDP only for the sanitizer to strip
+        the markup again; innerText gives the same text in one hop. The
+        HTML round-trip remains as a fallback for pages with no body text.
+        """
+        text = await page.evaluate("() => document.body ? document.body.innerText : ''")
+        if text:
+            return text[:_MAX_TEXT_CHARS]
+        return clean_html(await page.content())
+
+    @staticmethod
+    async def _goto(page, url: str) -> None:
+        """
+        Navigate and wait for the DOM, not network idle. networkidle stalls
+        for the full timeout on sites with long-tail analytics/beacon
+        traffic; the DOM is all we read, so domcontentloaded plus a short
+        bounded settle for late-rendered content is enough.
+        """
+        await page.goto(url, wait_until="domcontentloaded", timeout=15000)
+        try:
+            await page.wait_for_load_state("load", timeout=5000)
+        except Exception:
+            # Page kept loading in the background — the DOM is usable anyway.
+            pass
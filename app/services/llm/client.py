@@ -1,5 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Dict, List, Optional, Tuple, Type
 from pydantic import BaseModel
 
 class LLMClient(ABC):
@@ -41,3 +42,50 @@ class LLMClient(ABC):
         :return: List of valid labels applied to the text.
         """
         pass
+
+    async def classify_batch(
+        self,
+        texts: List[str],
+        labels: List[str],
+        multi_label: bool = False,
+    ) -> List[List[str]]:
+        """
+        Classify several texts, returning one label list per input text.
+
+        Default implementation fans out classify_text concurrently.
+        Providers that can pack all texts into a single request should
+        override this — one round-trip shares the prompt prefix across
+        items and is cheaper in both latency and tokens.
+
+        :param texts: Input texts, classified independently.
+        :param labels: List of allowed labels.
+        :param multi_label: Whether multiple labels can be returned per text.
+        :return: Label lists in the same order as texts.
+        """
+        return list(
+            await asyncio.gather(
+                *(self.classify_text(t, labels, multi_label=multi_label) for t in texts)
+            )
+        )
+
+    async def extract_and_classify(
+        self,
+        text: str,
+        schema: Type[BaseModel],
+        labels: List[str],
+        multi_label: bool = False,
+    ) -> Tuple[BaseModel, List[str]]:
+        """
+        Run extraction and classification concurrently.
+
+        The two calls share no data dependency, so issuing them together
+        makes the critical path max(t_extract, t_classify) instead of the
+        sum of two provider round-trips.
+
+        :return: (extracted model instance, applied labels)
+        """
+        extracted, applied = await asyncio.gather(
+            self.extract_data(text, schema),
+            self.classify_text(text, labels, multi_label=multi_label),
+        )
+        return extracted, applied
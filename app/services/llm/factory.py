@@ -1,3 +1,4 @@
+import os
 from typing import Optional
 from app.core.config import settings
 from app.services.llm.client import LLMClient
@@ -5,9 +6,20 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Provider SDKs are imported inside get_client branches so a process only
+# pays for the provider it actually uses (openai / google-genai each add
+# noticeable import time). Set AI_PRECHECK_EAGER_IMPORT=1 to pull them in at
+# startup instead, when first-request latency matters more than cold start.
+if os.environ.get("AI_PRECHECK_EAGER_IMPORT") == "1":
+    from app.services.llm.gemini_client import GeminiClient  # noqa: F401
+    from app.services.llm.openai_client import OpenAIClient  # noqa: F401
+
 
 class LLMFactory:
     _instances: dict[str, LLMClient] = {}
+    # Raw SDK clients shared across all LLMClient instances of a provider,
+    # so per-model wrappers reuse one connection pool.
+    _sdk_clients: dict[str, object] = {}
 
     @classmethod
     def get_client(cls, provider: str = None, model: str = None) -> LLMClient:
@@ -37,21 +49,36 @@ class LLMFactory:
             if not settings.OPENAI_API_KEY:
                 raise ValueError("OPENAI_API_KEY is not set. Use LLM_PROVIDER=mock for demo mode.")
             from app.services.llm.openai_client import OpenAIClient
-            client = OpenAIClient()
+            sdk = cls._sdk_clients.get("openai")
+            if sdk is None:
+                from openai import AsyncOpenAI
+                sdk = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+                cls._sdk_clients["openai"] = sdk
+            client = OpenAIClient(shared_client=sdk)
 
         elif provider == "gemini":
             if not settings.GEMINI_API_KEY:
                 raise ValueError("GEMINI_API_KEY is not set. Use LLM_PROVIDER=mock for demo mode.")
             from app.services.llm.gemini_client import GeminiClient
+            sdk = cls._sdk_clients.get("gemini")
+            if sdk is None:
+                from google import genai
+                sdk = genai.Client(api_key=settings.GEMINI_API_KEY)
+                cls._sdk_clients["gemini"] = sdk
             if model:
                 logger.info("Creating GeminiClient with model: %s", model)
-                client = GeminiClient(model=model)
+                client = GeminiClient(model=model, shared_client=sdk)
             else:
-                client = GeminiClient()
+                client = GeminiClient(shared_client=sdk)
 
         else:
             raise ValueError(f"Unsupported LLM provider: {provider}. Use 'openai', 'gemini', or 'mock'.")
 
+        # Best-effort connection warmup for providers that support it, so
+        # the first real request isn't the one paying TLS/auth setup.
+        if hasattr(client, "warmup"):
+            client.warmup()
+
         cls._instances[cache_key] = client
         return client
 
@@ -1,7 +1,10 @@
-import json
+import asyncio
 import logging
+import re
+from functools import lru_cache, partial
 from typing import List, Type, Optional
 
+import orjson
 from pydantic import BaseModel
 from google import genai
 from google.genai import types
@@ -11,11 +14,87 @@ from app.services.llm.client import LLMClient
 
 logger = logging.getLogger(__name__)
 
+# Models occasionally wrap output in markdown fences even with
+# response_mime_type="application/json"; one compiled regex strips both
+# fence lines in a single pass instead of guessing slice offsets.
+_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*\n?|\n?```\s*$", re.IGNORECASE | re.MULTILINE)
+
+# Request configs are invariant per call shape — build them once instead of
+# constructing a GenerateContentConfig on every request.
+_CLASSIFY_CONFIG = types.GenerateContentConfig(response_mime_type="application/json")
+_STREAM_CONFIG = types.GenerateContentConfig(temperature=0)
+_WARMUP_CONFIG = types.GenerateContentConfig(max_output_tokens=1)
+
+
+@lru_cache(maxsize=64)
+def _classify_prompt_prefix(labels: tuple, multi_label: bool) -> str:
+    """Static prompt prefix per (labels, multi_label) — the label sets are
+    a handful of stable lists, so the join/format runs once each."""
+    return (
+        f"Classify the following text into: {', '.join(labels)}.\n"
+        f"{'Return ALL applicable labels.' if multi_label else 'Return exactly ONE label.'}\n"
+        "Format: JSON object with key 'labels' containing a list of strings.\n"
+        "Text: "
+    )
+
+
+@lru_cache(maxsize=64)
+def _batch_classify_prompt_prefix(labels: tuple, multi_label: bool) -> str:
+    """Static prompt prefix for batched classification."""
+    return (
+        f"Classify each numbered item below into: {', '.join(labels)}.\n"
+        f"{'Return ALL applicable labels per item.' if multi_label else 'Return exactly ONE label per item.'}\n"
+        'Format: JSON object {"results": [{"id": <item number>, "labels": [<strings>]}]}.\n'
+        "Items:\n"
+    )
+
+
+@lru_cache(maxsize=64)
+def _extract_config(schema: Type[BaseModel]) -> types.GenerateContentConfig:
+    """Extraction config per response schema class."""
+    return types.GenerateContentConfig(
+        response_mime_type="application/json",
+        response_schema=schema,
+        temperature=0,
+    )
+
 
 class GeminiClient(LLMClient):
-    def __init__(self, api_key: str = None, model: str = "gemini-2.5-flash"):
-        self.client = genai.Client(api_key=api_key or settings.GEMINI_API_KEY)
+    def __init__(
+        self,
+        api_key: str = None,
+        model: str = "gemini-2.5-flash",
+        shared_client: genai.Client = None,
+    ):
+        # One genai.Client can serve every model name; sharing it keeps a
+        # single HTTP connection pool per process.
+        self.client = shared_client or genai.Client(api_key=api_key or settings.GEMINI_API_KEY)
         self.model_name = model
+        # Bind the model name once; call sites only supply contents/config.
+        self._generate = partial(self.client.aio.models.generate_content, model=model)
+        self._generate_stream = partial(
+            self.client.aio.models.generate_content_stream, model=model
+        )
+
+    def warmup(self) -> None:
+        """Fire a tiny background generation to warm TLS + auth.
+
+        The first real request then reuses the established connection
+        instead of paying the handshake on the critical path. Best-effort:
+        failures are logged, never raised.
+        """
+        async def _ping():
+            try:
+                await self._generate(contents="ping", config=_WARMUP_CONFIG)
+                logger.info("Gemini: connection warmed for %s", self.model_name)
+            except Exception as e:
+                logger.warning("Gemini warmup failed: %s", e)
+
+        try:
+            asyncio.get_running_loop().create_task(_ping())
+        except RuntimeError:
+            # No running loop (import/CLI time) — the first request warms.
+            pass
 
     async def extract_data(
         self,
@@ -29,14 +108,9 @@ class GeminiClient(LLMClient):
         logger.info("Gemini: sending extraction request to %s", self.model_name)
 
         try:
-            response = await self.client.aio.models.generate_content(
-                model=self.model_name,
+            response = await self._generate(
                 contents=f"{system_prompt}\n\nText:\n{text}",
-                config=types.GenerateContentConfig(
-                    response_mime_type="application/json",
-                    response_schema=schema,
-                    temperature=0,
-                ),
+                config=_extract_config(schema),
             )
 
             # SDK auto-parses JSON into the Pydantic model when response_schema is set
@@ -44,8 +118,13 @@ class GeminiClient(LLMClient):
                 logger.info("Gemini: extraction successful (parsed)")
                 return response.parsed
 
-            # Fallback: manual parsing if .parsed is None
-            content = response.text.strip()
+            # Fallback: manual parsing if .parsed is None. Accessing
+            # response.text walks the full proto message under the GIL —
+            # on multi-MB responses that stalls the event loop, so do the
+            # traversal and fence-strip in a worker thread.
+            content = await asyncio.to_thread(
+                lambda: _FENCE_RE.sub("", response.text).strip()
+            )
             logger.info("Gemini: parsing response manually (%d chars)", len(content))
             return schema.model_validate_json(content)
 
@@ -53,32 +132,81 @@ class GeminiClient(LLMClient):
             logger.error("Gemini extraction failed: %s", e, exc_info=True)
             raise RuntimeError(f"Gemini API call failed: {e}") from e
 
+    async def generate_text_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+    ):
+        """
+        Stream plain-text generation chunk by chunk.
+        Yields text fragments as Gemini produces them — used for long outputs
+        (policy documents) where waiting for the full response hurts TTFB.
+        """
+        contents = f"{system_prompt}\n\n{prompt}" if system_prompt else prompt
+
+        logger.info("Gemini: streaming generation from %s", self.model_name)
+
+        try:
+            stream = await self._generate_stream(
+                contents=contents,
+                config=_STREAM_CONFIG,
+            )
+            async for chunk in stream:
+                if chunk.text:
+                    yield chunk.text
+        except Exception as e:
+            logger.error("Gemini streaming failed: %s", e, exc_info=True)
+            raise RuntimeError(f"Gemini API call failed: {e}") from e
+
     async def classify_text(
         self,
         text: str,
         labels: List[str],
         multi_label: bool = False,
     ) -> List[str]:
-        prompt = (
-            f"Classify the following text into: {', '.join(labels)}.\n"
-            f"{'Return ALL applicable labels.' if multi_label else 'Return exactly ONE label.'}\n"
-            "Format: JSON object with key 'labels' containing a list of strings.\n"
-            f"Text: {text}"
-        )
+        prompt = _classify_prompt_prefix(tuple(labels), multi_label) + text
 
         try:
-            response = await self.client.aio.models.generate_content(
-                model=self.model_name,
+            response = await self._generate(
                 contents=prompt,
-                config=types.GenerateContentConfig(
-                    response_mime_type="application/json",
-                ),
+                config=_CLASSIFY_CONFIG,
             )
 
-            content = response.text.strip()
-            data = json.loads(content)
+            data = orjson.loads(response.text)
             return data.get("labels", [])
 
         except Exception as e:
             logger.error("Gemini classification failed: %s", e, exc_info=True)
             raise RuntimeError(f"Gemini API call failed: {e}") from e
+
+    async def classify_batch(
+        self,
+        texts: List[str],
+        labels: List[str],
+        multi_label: bool = False,
+    ) -> List[List[str]]:
+        """Classify all texts in one request using id markers."""
+        if not texts:
+            return []
+
+        prompt = _batch_classify_prompt_prefix(tuple(labels), multi_label) + "\n".join(
+            f"[{i}] {text}" for i, text in enumerate(texts, start=1)
+        )
+
+        try:
+            response = await self._generate(
+                contents=prompt,
+                config=_CLASSIFY_CONFIG,
+            )
+
+            data = orjson.loads(response.text)
+            by_id = {
+                int(item.get("id", 0)): item.get("labels", [])
+                for item in data.get("results", [])
+            }
+            # Items the model dropped come back as empty label lists.
+            return [by_id.get(i, []) for i in range(1, len(texts) + 1)]
+
+        except Exception as e:
+            logger.error("Gemini batch classification failed: %s", e, exc_info=True)
+            raise RuntimeError(f"Gemini API call failed: {e}") from e
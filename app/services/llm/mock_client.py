@@ -3,13 +3,75 @@ Mock LLM Client for demo/testing purposes.
 Returns deterministic data without calling any external API.
 Activate via LLM_PROVIDER=mock in .env or environment variables.
 """
+from functools import lru_cache
 from typing import List, Type, Optional
 from pydantic import BaseModel
+from app.core.config import settings
 from app.services.llm.client import LLMClient
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Demo extraction payload, built once — the mock's output never varies.
+_MOCK_PAYLOAD = {
+    # Section 1: Company Information
+    "company_name": "Demo Company Ltd",
+    "registration_number": "12345678",
+    "legal_address": "123 Demo Street, London, UK",
+    "vat_number": "GB123456789",
+    "merchant_outlet_location": "London, United Kingdom",
+    "has_license_info": False,
+    "license_number": None,
+    "regulator_link": None,
+
+    # Section 2: Contacts
+    "support_email": "support@demo.com",
+    "phone_number": "+44 20 1234 5678",
+    "physical_address": "123 Demo Street, London, UK",
+    "has_contact_page": True,
+
+    # Section 3: Policies
+    "has_terms_conditions": True,
+    "has_privacy_policy": True,
+    "has_refund_policy": True,
+    "has_cancellation_policy": False,
+    "has_payment_policy": False,
+    "policies_accessible_from_all_pages": True,
+    "policy_mentions_service_conditions": True,
+    "policy_mentions_cancellation_terms": False,
+    "policy_mentions_refund_terms": True,
+    "refund_period_days": 14,
+    "policy_mentions_user_restrictions": False,
+    "policy_mentions_company_name": True,
+    "site_primary_language": "English",
+
+    # Section 4: Product/Service
+    "has_product_description": True,
+    "prices_in_purchase_currency": True,
+    "all_fees_disclosed": True,
+    "transparent_purchase_process": True,
+
+    # Section 5: Checkout
+    "shows_final_price": True,
+    "shows_merchant_location_at_checkout": False,
+    "has_terms_agreement_checkbox": True,
+
+    # Section 6: Receipt
+    "has_receipt_info": True,
+
+    # Section 8: Mobile
+    "has_mobile_responsive": True,
+
+    # Extra
+    "payment_methods_mentioned": ["Visa", "MasterCard", "PayPal"],
+}
+
+
+@lru_cache(maxsize=32)
+def _mock_instance(schema: Type[BaseModel]) -> BaseModel:
+    """Validate the payload once per schema class and reuse the instance."""
+    return schema.model_validate(_MOCK_PAYLOAD)
+
 
 class MockClient(LLMClient):
     """Deterministic mock client for testing and demo without real API keys."""
@@ -21,58 +83,11 @@ class MockClient(LLMClient):
         system_prompt: Optional[str] = None,
     ) -> BaseModel:
         logger.info("MockClient: returning demo extraction data")
-        return schema.model_validate({
-            # Section 1: Company Information
-            "company_name": "Demo Company Ltd",
-            "registration_number": "12345678",
-            "legal_address": "123 Demo Street, London, UK",
-            "vat_number": "GB123456789",
-            "merchant_outlet_location": "London, United Kingdom",
-            "has_license_info": False,
-            "license_number": None,
-            "regulator_link": None,
-
-            # Section 2: Contacts
-            "support_email": "support@demo.com",
-            "phone_number": "+44 20 1234 5678",
-            "physical_address": "123 Demo Street, London, UK",
-            "has_contact_page": True,
-
-            # Section 3: Policies
-            "has_terms_conditions": True,
-            "has_privacy_policy": True,
-            "has_refund_policy": True,
-            "has_cancellation_policy": False,
-            "has_payment_policy": False,
-            "policies_accessible_from_all_pages": True,
-            "policy_mentions_service_conditions": True,
-            "policy_mentions_cancellation_terms": False,
-            "policy_mentions_refund_terms": True,
-            "refund_period_days": 14,
-            "policy_mentions_user_restrictions": False,
-            "policy_mentions_company_name": True,
-            "site_primary_language": "English",
-
-            # Section 4: Product/Service
-            "has_product_description": True,
-            "prices_in_purchase_currency": True,
-            "all_fees_disclosed": True,
-            "transparent_purchase_process": True,
-
-            # Section 5: Checkout
-            "shows_final_price": True,
-            "shows_merchant_location_at_checkout": False,
-            "has_terms_agreement_checkbox": True,
-
-            # Section 6: Receipt
-            "has_receipt_info": True,
-
-            # Section 8: Mobile
-            "has_mobile_responsive": True,
-
-            # Extra
-            "payment_methods_mentioned": ["Visa", "MasterCard", "PayPal"],
-        })
+        # Validation runs once per schema class; each call gets a shallow
+        # copy because callers may write back onto the extraction (e.g. the
+        # engine's payment-method backfill), and a shared cached instance
+        # would leak those writes across requests.
+        return _mock_instance(schema).model_copy()
 
     async def classify_text(
         self,
@@ -82,3 +97,25 @@ class MockClient(LLMClient):
     ) -> List[str]:
         logger.info("MockClient: returning first label as classification")
         return [labels[0]] if labels else []
+
+    async def classify_batch(
+        self,
+        texts: List[str],
+        labels: List[str],
+        multi_label: bool = False,
+    ) -> List[List[str]]:
+        logger.info("MockClient: returning first label for each of %d items", len(texts))
+        return [[labels[0]] if labels else [] for _ in texts]
+
+
+def _warmup() -> None:
+    """Pre-validate the payload against the main extraction schema so the
+    first compliance check doesn't pay Pydantic model init + validation."""
+    from app.modules.compliance.schemas import SiteContentExtraction
+
+    _mock_instance(SiteContentExtraction)
+
+
+# Only in demo mode — other providers shouldn't pay for the mock's warmup.
+if settings.LLM_PROVIDER == "mock":
+    _warmup()
@@ -1,4 +1,6 @@
 import json
+import orjson
+from functools import lru_cache
 from typing import List, Type, Optional
 from pydantic import BaseModel
 from openai import AsyncOpenAI
@@ -9,9 +11,46 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=64)
+def _classify_system_prompt(labels: tuple, multi_label: bool) -> str:
+    """Static system prompt per (labels, multi_label) pair."""
+    return (
+        f"Classify the following text into one of these categories: {', '.join(labels)}."
+        f"{' Return ALL applicable labels.' if multi_label else ' Return exactly ONE label.'}"
+        " Return result as a JSON object with a single key 'labels' containing a list of strings."
+    )
+
+
+@lru_cache(maxsize=64)
+def _batch_classify_system_prompt(labels: tuple, multi_label: bool) -> str:
+    """Static system prompt for batched classification."""
+    return (
+        f"Classify each numbered item in the user message into one of these categories: {', '.join(labels)}."
+        f"{' Return ALL applicable labels per item.' if multi_label else ' Return exactly ONE label per item.'}"
+        ' Return result as a JSON object: {"results": [{"id": <item number>, "labels": [<strings>]}]}.'
+    )
+
+
+@lru_cache(maxsize=64)
+def _schema_json(schema: Type[BaseModel]) -> str:
+    """JSON schema for a model class, generated once per class.
+
+    model_json_schema() walks every field and validator — tens of ms for the
+    big extraction schema — and its output is constant per class.
+    """
+    return json.dumps(schema.model_json_schema(), separators=(",", ":"))
+
+
 class OpenAIClient(LLMClient):
-    def __init__(self, api_key: str = None, model: str = "gpt-4-turbo-preview"):
-        self.client = AsyncOpenAI(api_key=api_key or settings.OPENAI_API_KEY)
+    def __init__(
+        self,
+        api_key: str = None,
+        model: str = "gpt-4-turbo-preview",
+        shared_client: AsyncOpenAI = None,
+    ):
+        # Reusing one AsyncOpenAI across instances shares its httpx
+        # connection pool, so per-model clients don't redo TLS handshakes.
+        self.client = shared_client or AsyncOpenAI(api_key=api_key or settings.OPENAI_API_KEY)
         self.model = model
 
     async def extract_data(
@@ -31,7 +70,7 @@ class OpenAIClient(LLMClient):
             messages=[
                 {
                     "role": "system",
-                    "content": f"{system_prompt}. Output strictly adhering to this JSON schema: {schema.model_json_schema()}",
+                    "content": f"{system_prompt}. Output strictly adhering to this JSON schema: {_schema_json(schema)}",
                 },
                 {"role": "user", "content": text},
             ],
@@ -46,11 +85,7 @@ class OpenAIClient(LLMClient):
         labels: List[str],
         multi_label: bool = False,
     ) -> List[str]:
-        system_prompt = (
-            f"Classify the following text into one of these categories: {', '.join(labels)}."
-            f"{' Return ALL applicable labels.' if multi_label else ' Return exactly ONE label.'}"
-            " Return result as a JSON object with a single key 'labels' containing a list of strings."
-        )
+        system_prompt = _classify_system_prompt(tuple(labels), multi_label)
 
         completion = await self.client.chat.completions.create(
             model=self.model,
@@ -62,5 +97,35 @@ class OpenAIClient(LLMClient):
         )
 
         content = completion.choices[0].message.content
-        data = json.loads(content)
+        data = orjson.loads(content)
         return data.get("labels", [])
+
+    async def classify_batch(
+        self,
+        texts: List[str],
+        labels: List[str],
+        multi_label: bool = False,
+    ) -> List[List[str]]:
+        """Classify all texts in one request using id markers."""
+        if not texts:
+            return []
+
+        items = "\n".join(f"[{i}] {text}" for i, text in enumerate(texts, start=1))
+
+        completion = await self.client.chat.completions.create(
+            model=self.model,
+            response_format={"type": "json_object"},
+            messages=[
+                {"role": "system", "content": _batch_classify_system_prompt(tuple(labels), multi_label)},
+                {"role": "user", "content": items},
+            ],
+        )
+
+        content = completion.choices[0].message.content
+        data = orjson.loads(content)
+        by_id = {
+            int(item.get("id", 0)): item.get("labels", [])
+            for item in data.get("results", [])
+        }
+        # Items the model dropped come back as empty label lists.
+        return [by_id.get(i, []) for i in range(1, len(texts) + 1)]
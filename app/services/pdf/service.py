@@ -1,6 +1,6 @@
 from pathlib import Path
 from typing import Dict, Any
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
 from app.core.config import settings
 import logging
 
@@ -12,13 +12,29 @@ except OSError:
     WEASYPRINT_AVAILABLE = False
     logging.warning("WeasyPrint not available (missing GTK libraries). PDF generation will be mocked.")
 
+_TEMPLATE_DIR = Path(__file__).parent / "templates"
+
+# One environment for all instances, with an on-disk bytecode cache (in the
+# system temp dir) so template compilation survives worker restarts instead
+# of re-running per boot.
+_ENV = Environment(
+    loader=FileSystemLoader(_TEMPLATE_DIR),
+    autoescape=select_autoescape(['html', 'xml']),
+    bytecode_cache=FileSystemBytecodeCache(),
+)
+
+# Warm the report template at import — first request then renders directly.
+try:
+    _ENV.get_template("compliance_report.html")
+except Exception:
+    # Missing/broken template surfaces at render time, as before.
+    pass
+
+
 class PdfService:
     def __init__(self):
-        self.template_dir = Path(__file__).parent / "templates"
-        self.env = Environment(
-            loader=FileSystemLoader(self.template_dir),
-            autoescape=select_autoescape(['html', 'xml'])
-        )
+        self.template_dir = _TEMPLATE_DIR
+        self.env = _ENV
 
     def generate_report(self, data: Dict[str, Any], output_path: str = None) -> bytes:
         """
@@ -1,15 +1,64 @@
+import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Overlap wheel downloads where pip supports it (newer pips read this env
+# knob; older ones ignore it and download sequentially as before). Browser
+# binaries (>300 MB) are skipped by default — tests mock Playwright entirely.
+_ENV = {
+    **os.environ,
+    "PIP_PARALLEL_DOWNLOADS": "8",
+    "PLAYWRIGHT_SKIP_BROWSER_DOWNLOAD": "1",
+}
+
+# Pinned snapshot of a known-good environment, written after a clean
+# bootstrap install. Installing from it skips pip's backtracking resolver.
+LOCKFILE = "requirements.lock"
+
+# Packages that may legitimately need an sdist build on some platforms.
+# Everything else must ship as a wheel so installing is a tar-extract, never
+# a C/Rust compile.
+SDIST_OK = {"weasyprint"}
+
+# Deliberate cache policy per environment (INSTALL_MODE): CI points at a
+# mountable cache volume so re-runs are tar extracts; docker-final skips the
+# cache so the image layer isn't bloated by ~200 MB of wheels; dev keeps
+# pip's default user cache.
+_INSTALL_MODE = os.getenv("INSTALL_MODE", "dev")
+if _INSTALL_MODE == "ci":
+    _CACHE_ARGS = ["--cache-dir=/root/.cache/pip"]
+elif _INSTALL_MODE == "docker-final":
+    _CACHE_ARGS = ["--no-cache-dir"]
+else:
+    _CACHE_ARGS = []
+
+def _pip_install(*args):
+    subprocess.check_call(
+        [sys.executable, "-m", "pip", "install", "--no-input", *_CACHE_ARGS, *args],
+        env=_ENV,
+    )
+
+def _binary_flag(package):
+    return "--prefer-binary" if package in SDIST_OK else "--only-binary=:all:"
 
 def install(package):
-    subprocess.check_call([sys.executable, "-m", "pip", "install", package])
+    _pip_install(_binary_flag(package), package)
+
+def install_all(packages):
+    wheels = [p for p in packages if p not in SDIST_OK]
+    sdists = [p for p in packages if p in SDIST_OK]
+    if wheels:
+        _pip_install("--only-binary=:all:", *wheels)
+    if sdists:
+        _pip_install("--prefer-binary", *sdists)
 
 if __name__ == "__main__":
     pkgs = [
-        "pytest", 
-        "pytest-asyncio", 
-        "httpx", 
-        "sqlalchemy", 
+        "pytest",
+        "pytest-asyncio",
+        "httpx",
+        "sqlalchemy",
         "alembic",
         "pydantic",
         "pydantic-settings",
@@ -21,13 +70,48 @@ if __name__ == "__main__":
         "tenacity",
         "openai",
         "google-generativeai",
-        "weasyprint"
+        "weasyprint",
+        "orjson",
+        "uvloop; sys_platform != 'win32'"
     ]
-    for pkg in pkgs:
+    if os.path.exists(LOCKFILE):
+        # Fast path: the set was resolved once already — install the pinned
+        # versions with --no-deps and skip resolution entirely.
+        print(f"Installing pinned dependencies from {LOCKFILE}...")
+        _pip_install("--no-deps", "-r", LOCKFILE)
+    else:
+        # Bootstrap path. One pip invocation resolves the whole set in a
+        # single pass instead of paying pip startup + re-resolution once
+        # per package.
         try:
-            print(f"Installing {pkg}...")
-            install(pkg)
-        except Exception as e:
-            print(f"Failed to install {pkg}: {e}")
+            print(f"Installing {len(pkgs)} packages...")
+            install_all(pkgs)
+            # Freeze the resolved set so future runs take the fast path.
+            with open(LOCKFILE, "w") as f:
+                subprocess.check_call([sys.executable, "-m", "pip", "freeze"], stdout=f)
+            print(f"Wrote {LOCKFILE}.")
+        except subprocess.CalledProcessError:
+            # Batched install failed — retry individually so a single broken
+            # package doesn't block the rest, and in parallel so one slow
+            # download doesn't serialize the others. The work happens in pip
+            # subprocesses, so threads are only waiting, not fighting the
+            # GIL. No lockfile is written for a partial install.
+            print("Batched install failed, retrying packages individually...")
+            with ThreadPoolExecutor(max_workers=min(8, len(pkgs))) as ex:
+                futures = {ex.submit(install, pkg): pkg for pkg in pkgs}
+                for future in as_completed(futures):
+                    pkg = futures[future]
+                    try:
+                        future.result()
+                        print(f"Installed {pkg}.")
+                    except Exception as e:
+                        print(f"Failed to install {pkg}: {e}")
+
+    # Opt-in: only environments that really crawl need Chromium.
+    if os.getenv("INSTALL_PLAYWRIGHT_BROWSERS") == "1":
+        print("Installing Playwright browsers (Chromium)...")
+        subprocess.check_call(
+            [sys.executable, "-m", "playwright", "install", "--with-deps", "chromium"]
+        )
 
     print("Dependencies installed.")
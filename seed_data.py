@@ -1,71 +1,193 @@
 """
 Seed script for initial demo data.
-Run once to populate the database with a sample policy template and widget config.
+Run once to populate the database with a sample policy template, an approved
+policy, and a widget config for the demo client.
 Tables are created automatically on app startup — this only needs to create demo data.
+This is the single seed entry point; destructive re-seeds go through --reset
+rather than a separate script.
 """
+import argparse
 import asyncio
-import json
-from app.infrastructure.database import engine, AsyncSessionLocal
-from app.modules.policies.models import Base, PolicyTemplate, ClientWidget
-from sqlalchemy import select
+from app.infrastructure.database import engine
+from app.modules.policies.models import Base, ClientPolicy, PolicyTemplateMaster, Widget
+from sqlalchemy import insert, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
 
+DEMO_CLIENT_ID = "demo-client-123"
 
-async def seed():
+PROMPT_TEMPLATE = """Generate a Privacy Policy in clean HTML for {company_name}.
+The company operates from {company_address} and can be reached at {contact_email}.
+Cover data collection, retention, and user rights. Language: {language}."""
+
+DEMO_POLICY_HTML = """
+<h2>Privacy Policy for Demo Corp Ltd.</h2>
+<p>Effective Date: 2026-02-12</p>
+<p>We value your privacy. This policy describes how Demo Corp Ltd. collects data.</p>
+<ul>
+    <li>Data Controller: privacy@demo.com</li>
+    <li>Data Retention: 3 years</li>
+</ul>
+<p>Contact us at <a href="mailto:privacy@demo.com">privacy@demo.com</a>.</p>
+"""
+
+
+async def _bulk_insert(session, model, rows):
+    """Insert rows through one multi-row statement instead of per-row adds.
+
+    Today's seed only has a handful of rows, but this is the pattern to
+    extend when demo data grows: round trips stay O(1) in the row count.
+    Large PostgreSQL batches switch to asyncpg's COPY protocol, which
+    streams rows instead of binding them through INSERT.
+    """
+    if not rows:
+        return
+    if len(rows) > 100 and session.bind.dialect.name == "postgresql":
+        conn = await session.connection()
+        raw = (await conn.get_raw_connection()).driver_connection
+        columns = list(rows[0])
+        await raw.copy_records_to_table(
+            model.__tablename__,
+            records=[tuple(row[col] for col in columns) for row in rows],
+            columns=columns,
+        )
+        return
+    await session.execute(insert(model).values(rows))
+
+
+def _compile_pg(stmt) -> str:
+    """Render a statement with inline literals for the one-round-trip path.
+
+    Safe here because every seed value is a static literal from this file;
+    the dialect handles quoting.
+    """
+    return str(
+        stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    )
+
+
+async def seed(reset: bool = False):
     if not engine:
         print("ERROR: Database engine not initialized. Check DATABASE_URL.")
         return
 
-    # Ensure tables exist (idempotent)
-    async with engine.begin() as conn:
+    # One connection carries both the DDL and the inserts: on asyncpg the
+    # per-connection statement cache then reuses prepared plans instead of
+    # re-parsing on a second pooled connection.
+    async with engine.connect() as conn:
+        # Ensure tables exist (idempotent). Dropping first is opt-in — a
+        # plain re-seed must not pay the DDL round trips or wipe dev data.
+        if reset:
+            print("Resetting schema (--reset): dropping all tables.")
+            await conn.run_sync(Base.metadata.drop_all)
         await conn.run_sync(Base.metadata.create_all)
+        await conn.commit()
 
-    async with AsyncSessionLocal() as session:
-        # Check if data already exists
-        result = await session.execute(
-            select(ClientWidget).where(ClientWidget.id == "demo-client-123")
-        )
-        if result.scalar_one_or_none():
-            print("Demo data already exists. Skipping seed.")
-            return
-
-        # Create Template
-        template = PolicyTemplate(
-            slug="privacy-v1",
-            name="Standard Privacy Policy",
-            content_template="""
-            <h2>Privacy Policy for {{ company_name }}</h2>
-            <p>Effective Date: {{ date }}</p>
-            <p>We value your privacy. This policy describes how {{ company_name }} collects data.</p>
-            <ul>
-                <li>Data Controller: {{ contact_email }}</li>
-                <li>Data Retention: {{ retention_years }} years</li>
-            </ul>
-            <p>Contact us at <a href="mailto:{{ contact_email }}">{{ contact_email }}</a>.</p>
-            """,
-            version=1,
-        )
-        session.add(template)
-        await session.commit()
-        await session.refresh(template)
-
-        # Create Widget Config for Demo Client
-        widget = ClientWidget(
-            id="demo-client-123",
-            domain="localhost",
-            policy_template_id=template.id,
-            config_json=json.dumps({
-                "company_name": "Demo Corp Ltd.",
-                "date": "2026-02-12",
-                "contact_email": "privacy@demo.com",
-                "retention_years": 3,
-            }),
-        )
-        session.add(widget)
-        await session.commit()
+        async with AsyncSession(bind=conn) as session:
+            # One transaction, one commit: INSERT ... RETURNING hands the
+            # generated template id to the policy insert without the extra
+            # SELECT that refresh() would emit, and only one fsync happens.
+            async with session.begin():
+                existing = await session.execute(
+                    select(Widget.token).where(Widget.client_id == DEMO_CLIENT_ID).limit(1)
+                )
+                if existing.first():
+                    print("Demo data already exists. Skipping seed.")
+                    return
+
+                # Every Python-side column default is spelled out explicitly:
+                # the literal-compiled fast path below renders omitted
+                # defaulted columns as NULL instead of applying the default.
+                template_stmt = insert(PolicyTemplateMaster).values(
+                    policy_type="privacy",
+                    jurisdiction="GENERAL",
+                    language="en",
+                    prompt_template=PROMPT_TEMPLATE,
+                    version=1,
+                    is_active=True,
+                )
+
+                if session.bind.dialect.name == "postgresql":
+                    # Pack all three inserts into one simple-query exchange
+                    # via the raw asyncpg connection; currval() carries the
+                    # template id to the policy row server-side, so the whole
+                    # seed DML is a single network round trip.
+                    policy_stmt = insert(ClientPolicy).values(
+                        id="pol_demo_privacy",
+                        client_id=DEMO_CLIENT_ID,
+                        policy_type="privacy",
+                        master_template_id=text(
+                            "currval(pg_get_serial_sequence('policy_templates_master', 'id'))"
+                        ),
+                        master_version_used=1,
+                        content_html=DEMO_POLICY_HTML,
+                        jurisdiction="GENERAL",
+                        language="en",
+                        status="approved",
+                        version=1,
+                    )
+                    widget_stmt = insert(Widget).values(
+                        token="wt_pub_demo",
+                        client_id=DEMO_CLIENT_ID,
+                        domain="localhost",
+                        is_active=True,
+                        theme_config=text("'{}'::jsonb"),
+                    )
+                    multi_sql = ";\n".join(
+                        _compile_pg(s) for s in (template_stmt, policy_stmt, widget_stmt)
+                    )
+                    raw_conn = await session.connection()
+                    raw = (await raw_conn.get_raw_connection()).driver_connection
+                    await raw.execute(multi_sql)
+                else:
+                    # Portable path: RETURNING threads the template id into
+                    # the dependent insert; still one transaction/commit.
+                    template_id = (
+                        await session.execute(
+                            template_stmt.returning(PolicyTemplateMaster.id)
+                        )
+                    ).scalar_one()
+
+                    await _bulk_insert(
+                        session,
+                        ClientPolicy,
+                        [
+                            {
+                                "id": "pol_demo_privacy",
+                                "client_id": DEMO_CLIENT_ID,
+                                "policy_type": "privacy",
+                                "master_template_id": template_id,
+                                "content_html": DEMO_POLICY_HTML,
+                                "status": "approved",
+                                "version": 1,
+                            }
+                        ],
+                    )
+
+                    await _bulk_insert(
+                        session,
+                        Widget,
+                        [
+                            {
+                                "token": "wt_pub_demo",
+                                "client_id": DEMO_CLIENT_ID,
+                                "domain": "localhost",
+                                "is_active": True,
+                                "theme_config": {},
+                            }
+                        ],
+                    )
 
-        print("Database seeded successfully!")
-        print("Demo Widget ID: demo-client-123")
+            print("Database seeded successfully!")
+            print(f"Demo Client ID: {DEMO_CLIENT_ID}")
 
 
 if __name__ == "__main__":
-    asyncio.run(seed())
+    parser = argparse.ArgumentParser(description="Seed the database with demo data.")
+    parser.add_argument(
+        "--reset",
+        action="store_true",
+        help="Drop and recreate all tables before seeding (destructive).",
+    )
+    args = parser.parse_args()
+    asyncio.run(seed(reset=args.reset))
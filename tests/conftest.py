@@ -0,0 +1,47 @@
+"""
+Shared test fixtures.
+weasyprint drags in the Cairo/Pango native extensions at import time; tests
+never render real PDFs, so one preconfigured MagicMock stands in for the
+module. It is built exactly once here — per-test construction of fresh mocks
+is wasted fixture time.
+"""
+import asyncio
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+import pytest_asyncio.plugin as _pytest_asyncio_plugin
+
+_weasyprint_mock = MagicMock()
+_weasyprint_mock.HTML.return_value.write_pdf.return_value = b"%PDF-1.4 mock pdf content..."
+sys.modules.setdefault("weasyprint", _weasyprint_mock)
+
+
+@pytest.fixture(scope="session")
+def weasyprint_mock():
+    """The cached weasyprint stub, already configured to emit PDF bytes."""
+    return sys.modules["weasyprint"]
+
+
+# Run async tests under uvloop (declared as a dev dependency on non-Windows
+# platforms). These tests mock every I/O boundary, so runtime is almost
+# entirely event-loop dispatch of trivial awaits — exactly where uvloop's
+# C-level task implementation helps most. Falls back to the stdlib loop when
+# uvloop is absent (e.g. on Windows).
+if hasattr(_pytest_asyncio_plugin, "PytestAsyncioSpecs"):
+    # pytest-asyncio >= 1.3: loop customization goes through this hook and
+    # the event_loop_policy fixture is deprecated.
+    def pytest_asyncio_loop_factories(config, item):
+        try:
+            import uvloop
+        except ImportError:
+            return {"asyncio": asyncio.new_event_loop}
+        return {"uvloop": uvloop.new_event_loop}
+else:
+    @pytest.fixture(scope="session")
+    def event_loop_policy():
+        try:
+            import uvloop
+        except ImportError:
+            return asyncio.DefaultEventLoopPolicy()
+        return uvloop.EventLoopPolicy()
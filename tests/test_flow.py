@@ -1,8 +1,8 @@
-import sys
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
 
-# Mock weasyprint before importing app modules that depend on it
-sys.modules["weasyprint"] = MagicMock()
+# weasyprint is stubbed in conftest.py, which pytest imports before any test
+# module — app imports below never touch the real native extension.
 
 import pytest
 from app.modules.compliance.engine import ComplianceRuleEngine
@@ -10,57 +10,92 @@ from app.modules.compliance.schemas import SiteContentExtraction
 from app.services.crawler.service import CrawlerService
 from app.services.pdf.service import PdfService
 
+
+@pytest.fixture(scope="module")
+def patched_playwright():
+    """Install a preconfigured Playwright mock once per module.
+
+    Entering patch(...) inside each test rebinds the import path on every
+    run; one module-scoped MonkeyPatch pays that cost once.
+    """
+    mp = pytest.MonkeyPatch()
+    mock_playwright = MagicMock()
+    mock_browser = AsyncMock()
+    mock_page = AsyncMock()
+    mock_playwright.return_value.__aenter__.return_value.chromium.launch.return_value = mock_browser
+    mock_browser.new_page.return_value = mock_page
+    mock_page.evaluate.return_value = "Privacy Policy Contact: info@example.com"
+    mp.setattr("playwright.async_api.async_playwright", mock_playwright)
+    # crawl_page pre-resolves the hostname for SSRF checks; stub it so the
+    # test does no real DNS lookup (slow, and a filtering resolver that
+    # answers with a private address would error the crawl).
+    mp.setattr("app.services.crawler.service._assert_public_host", AsyncMock())
+    yield mock_page
+    mp.undo()
+
+
+@pytest.fixture(scope="module")
+def patched_llm_factory():
+    """Route LLMFactory.get_client to one shared AsyncMock client."""
+    mp = pytest.MonkeyPatch()
+    mock_client = AsyncMock()
+    mp.setattr(
+        "app.services.llm.factory.LLMFactory.get_client",
+        MagicMock(return_value=mock_client),
+    )
+    yield mock_client
+    mp.undo()
+
+
+@pytest.fixture(scope="module")
+def extraction():
+    """The mocked extraction payload, built once for the whole module."""
+    return SiteContentExtraction(
+        company_name="Example Corp",
+        has_privacy_policy=True,
+        has_terms_of_service=False, # Should trigger issue
+        has_refund_policy=True,
+        refund_period_days=30,
+        has_contact_details=True,
+        payment_methods_mentioned=["Visa"]
+    )
+
+
+@pytest.fixture(scope="module")
+def engine(patched_llm_factory):
+    """One engine per module — __init__ resolves the LLM client through
+    the (patched) factory, which only needs to happen once."""
+    return ComplianceRuleEngine()
+
+
+@pytest.fixture(scope="module")
+def report(patched_llm_factory, engine, extraction):
+    """Compliance report produced once from the mocked extraction.
+
+    The PDF and scoring tests only read the report, so the engine runs a
+    single analysis per module instead of once per test.
+    """
+    patched_llm_factory.extract_data.return_value = extraction
+    return asyncio.run(engine.analyze_site("Privacy Policy Contact: info@example.com"))
+
+
 @pytest.mark.asyncio
-async def test_compliance_workflow():
-    # 1. Mock Crawler
-    with patch("app.services.crawler.service.async_playwright") as mock_playwright:
-        mock_browser = AsyncMock()
-        mock_page = AsyncMock()
-        # Mock the context manager for playwright
-        mock_playwright.return_value.__aenter__.return_value.chromium.launch.return_value = mock_browser
-        mock_browser.new_page.return_value = mock_page
-        mock_page.content.return_value = "<html><body><footer>Privacy Policy</footer></body></html>"
-        
-        crawler = CrawlerService()
-        # Mock sanitizer to return clean text
-        crawler.sanitizer.clean_html = MagicMock(return_value="Privacy Policy Contact: info@example.com")
-        
-        text = await crawler.crawl_page("http://example.com")
-        assert text == "Privacy Policy Contact: info@example.com"
-
-    # 2. Mock LLM Extraction
-    with patch("app.services.llm.factory.LLMFactory.get_client") as mock_factory:
-        mock_client = AsyncMock()
-        mock_factory.return_value = mock_client # The factory returns the client instance directly in our impl, wait, let's check factory.py
-        # Factory.get_client returns an instance.
-        
-        # Define mock extracted data
-        mock_data = SiteContentExtraction(
-            company_name="Example Corp",
-            has_privacy_policy=True,
-            has_terms_of_service=False, # Should trigger issue
-            has_refund_policy=True,
-            refund_period_days=30,
-            has_contact_details=True,
-            payment_methods_mentioned=["Visa"]
-        )
-        mock_client.extract_data.return_value = mock_data
-
-        engine = ComplianceRuleEngine()
-        # We need to make sure the engine uses our mocked client. 
-        # Since engine init calls factory, and we patched factory...
-        
-        report = await engine.analyze_site(text)
-        
-        assert report.company_name == "Example Corp"
-        assert report.score < 100 # Should lose points for missing ToS
-        assert any(i.rule_id == "POL-002" for i in report.critical_issues)
-
-    # 3. Test PDF Generation
-    # Configure the global mock to return bytes
-    # HTML() returns a document mock, .write_pdf() returns the bytes
-    sys.modules["weasyprint"].HTML.return_value.write_pdf.return_value = b"%PDF-1.4 mock pdf content..."
-    
+async def test_crawler_returns_sanitized_text(patched_playwright):
+    crawler = CrawlerService()
+    text = await crawler.crawl_page("http://example.com")
+    assert text == "Privacy Policy Contact: info@example.com"
+
+
+def test_compliance_engine_scores_missing_tos(report):
+    assert report.company_name == "Example Corp"
+    assert report.score < 100 # Should lose points for missing ToS
+    # POL-001 is the Terms & Conditions rule; the extraction has no ToS.
+    assert any(i.rule_id == "POL-001" and i.status == "fail" for i in report.checklist)
+
+
+def test_pdf_service_returns_pdf_bytes(weasyprint_mock, report):
+    # The weasyprint_mock fixture already configures HTML().write_pdf()
+    # to return PDF bytes — no per-test reconfiguration needed.
     pdf_service = PdfService()
     pdf_bytes = pdf_service.generate_report(report.model_dump())
     assert len(pdf_bytes) > 0
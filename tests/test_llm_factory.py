@@ -0,0 +1,8 @@
+from app.services.llm.factory import LLMFactory
+
+
+def test_get_client_returns_cached_singleton():
+    """Repeated lookups for the same provider must reuse one client."""
+    first = LLMFactory.get_client("mock")
+    second = LLMFactory.get_client("mock")
+    assert first is second